@@ -1,15 +1,22 @@
 """Full analysis pipeline for AutoBioinformatics."""
 
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
 import typing as tp
 from collections import defaultdict
 from itertools import permutations
 from pathlib import Path
 
 import gseapy as gp
+import numpy as np
 import numpy.typing as npt
-import matplotlib.pyplot as plt
 import pandas as pd
-from scipy.stats import ttest_ind
+from joblib import Parallel, delayed
+from scipy.stats import ttest_ind_from_stats
 from tqdm import tqdm
 
 import auto_bioinformatics.imputers as imputers
@@ -38,6 +45,9 @@ class AutoAnalysis:
         organism: str = "Human",
         plot_dir: Path = Path("img"),
         output_dir: Path = Path("out"),
+        n_jobs: int = -1,
+        output_format: str = "xlsx",
+        enrichr_cache_days: float = 7,
     ) -> None:
         """Initialise an AutoAnalysis object.
 
@@ -49,12 +59,32 @@ class AutoAnalysis:
             gene_sets (tp.List[str], optional): Gene sets for pathway analysis. Defaults to ["KEGG_2019_Human"].
             organism (str, optional): Organism to lookup in pathway analysis. Defaults to "Human".
             plot_dir (Path, optional): Directory for plots to go. Defaults to Path("img").
-            output_dir (Path, optional): Directory for output excel files to go. Defaults to Path("out").
+            output_dir (Path, optional): Directory for output tables to go. Defaults to Path("out").
+            n_jobs (int, optional): Number of processes to save and plot group comparisons with, -1 uses all cores. Defaults to -1.
+            output_format (str, optional): File type for output tables, one of "xlsx", "csv" or "parquet". Parquet requires pyarrow. Defaults to "xlsx".
+            enrichr_cache_days (float, optional): Days to reuse cached Enrichr results for, 0 always queries Enrichr. Defaults to 7.
         """
-        self.data = data
+        self._data = data
         self.groups = groups
         self.gene_name_col = gene_name_col
 
+        # Map each group to its columns once, rather than searching on every lookup
+        self._group_cols = {
+            group: [col for col in data.columns if group in col] for group in groups
+        }
+
+        # Every stage reads and writes the numeric data as one contiguous array.
+        # The data property copies it back into the DataFrame before the frame is
+        # read, and the array is reloaded after the frame has been handed out, so
+        # the two never disagree.
+        self._data_cols = self._get_group_cols(groups)
+        self._col_index = {col: i for i, col in enumerate(self._data_cols)}
+        self._array: tp.Optional[npt.NDArray] = None
+        self._array_changed = False
+        self._group_stats: tp.Optional[
+            tp.Tuple[npt.NDArray, npt.NDArray, npt.NDArray]
+        ] = None
+
         self.missing_data_percentage = self._calculate_missing_data()
 
         self.p_value_threshold = p_value_threshold
@@ -66,28 +96,89 @@ class AutoAnalysis:
         self.plot_dir = plot_dir
         self.output_dir = output_dir
 
+        self.n_jobs = n_jobs
+
+        if output_format not in ("xlsx", "csv", "parquet"):
+            raise ValueError(f"Output format {output_format} not supported.")
+
+        # Check for pyarrow now, rather than failing once the data has been processed
+        if output_format == "parquet":
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError(
+                    "Saving parquet files requires pyarrow, install it with the "
+                    "auto-bioinformatics[parquet] extra."
+                ) from None
+
+        self.output_format = output_format
+
+        self.enrichr_cache_days = enrichr_cache_days
+
         self.imputer: tp.Optional[imputers.Imputer] = None
         self.reducer: tp.Optional[reducers.Reducer] = None
         self.normaliser: tp.Optional[normalisers.Normaliser] = None
         self.de_paths: tp.Optional[tp.Dict[str, tp.Dict]] = None
 
+        self._deferred_plots: tp.Optional[tp.List[tp.Any]] = None
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """Data being analysed, including any stages that have been run on it."""
+        if self._array_changed:
+            self._data[self._data_cols] = self._array
+            self._array_changed = False
+
+        # The frame may be edited by the caller, so reload the array before its
+        # next use
+        self._array = None
+
+        return self._data
+
+    @data.setter
+    def data(self, data: pd.DataFrame) -> None:
+        self._data = data
+        self._array = None
+        self._array_changed = False
+
+    @property
+    def _values(self) -> npt.NDArray:
+        """Current values of the data columns, as one contiguous array."""
+        if self._array is None:
+            self._array = self._data.loc[:, self._data_cols].to_numpy(
+                dtype=np.float64, copy=True
+            )
+            self._group_stats = None
+
+        return self._array
+
     def run(self):
         """Run the full analysis pipeline."""
         self._check_dirs_exist()
 
-        self._clean_gene_names()
+        # Hold plots back until the end of the run, so they can be rendered in
+        # parallel rather than one at a time between stages
+        self._deferred_plots = []
 
-        self._scale_data()
+        try:
+            self._clean_gene_names()
+
+            self._scale_data()
+
+            self._impute_data()
 
-        self._impute_data()
+            self._normalise_data()
 
-        self._normalise_data()
+            self._save_data(output_file=f"imputed_and_normalised.{self.output_format}")
 
-        self._save_data(output_file="imputed_and_normalised.xlsx")
+            self._run_pca(plot=True, output_file="pca.png")
 
-        self._run_pca(plot=True, output_file="pca.png")
+            self._run_all_de_analysis()
 
-        self._run_all_de_analysis()
+        finally:
+            # Render whatever was queued even if a later stage failed, so plots of
+            # the stages that finished are still saved
+            self._render_deferred_plots()
 
     def _scale_data(self, scaler: scalers.Scaler = scalers.Log2Scaler()) -> None:
         """Scale the data using a scaler object.
@@ -97,11 +188,11 @@ class AutoAnalysis:
         """
         data_cols = self._get_group_cols(self.groups)
 
-        data = self.data.loc[:, data_cols]
+        data = self._get_values(data_cols)
 
         self.scaler = scaler
 
-        self.data.loc[:, data_cols] = scaler.fit_transform(data)
+        self._set_values(data_cols, scaler.fit_transform(data))
 
     def _impute_data(
         self,
@@ -121,20 +212,24 @@ class AutoAnalysis:
         for group in tqdm(self.groups, desc="Imputing data..."):
             data_cols = self._get_group_cols(group)
 
-            data = self.data.loc[:, data_cols]
+            data = self._get_values(data_cols)
+
+            new_data = imputer.fit_transform(data)
 
             if plot:
                 # Set an attribute to store the path to the imputation plot
                 self.imputation_plot_path = self.plot_dir / (
                     output_file.stem + f"_{group}" + output_file.suffix
                 )
-                new_data = imputer.fit_transform(data)
-                plots.ImputationPlot(
-                    data,
-                    new_data,
-                    self.imputation_plot_path,
-                ).plot()
-                self.data.loc[:, data_cols] = imputer.fit_transform(data)
+                self._queue_plot(
+                    plots.ImputationPlot(
+                        data,
+                        new_data,
+                        self.imputation_plot_path,
+                    )
+                )
+
+            self._set_values(data_cols, new_data)
 
     def _normalise_data(
         self, normaliser: normalisers.Normaliser = normalisers.PowerScaler()
@@ -146,11 +241,11 @@ class AutoAnalysis:
         """
         data_cols = self._get_group_cols(self.groups)
 
-        data = self.data.loc[:, data_cols]
+        data = self._get_values(data_cols)
 
         self.normaliser = normaliser
 
-        self.data.loc[:, data_cols] = normaliser.fit_transform(data)
+        self._set_values(data_cols, normaliser.fit_transform(data))
 
     def _run_pca(
         self,
@@ -167,7 +262,7 @@ class AutoAnalysis:
         """
         data_cols = self._get_group_cols(self.groups)
 
-        data = self.data.loc[:, data_cols].dropna()
+        data = self._get_values(data_cols).dropna()
 
         self.reducer = dim_reducer
 
@@ -175,13 +270,15 @@ class AutoAnalysis:
 
         if plot:
             self.dim_reducer_plot_path = self.plot_dir / output_file
-            plots.ProjectionPlot(
-                pca_data,
-                dim_reducer,
-                self.dim_reducer_plot_path,
-                data_cols,
-                self.groups,
-            ).plot()
+            self._queue_plot(
+                plots.ProjectionPlot(
+                    pca_data,
+                    dim_reducer,
+                    self.dim_reducer_plot_path,
+                    data_cols,
+                    self.groups,
+                )
+            )
 
         return pca_data
 
@@ -189,25 +286,53 @@ class AutoAnalysis:
         """Run differential expression analysis for all permutations of groups."""
         self.de_paths = defaultdict(dict)
 
-        for group1_name, group2_name in tqdm(permutations(self.groups, 2)):
-            plt.close("all")
-            fig_path = self.plot_dir / (
-                "_".join([group1_name, group2_name]) + "_volcano.png"
-            )
+        log_fold_changes, p_values = self._run_batched_t_test()
 
-            self.de_paths[f"{group1_name}_{group2_name}"]["volcano_fig"] = fig_path
+        # Genes without a name can't be reported, so treat them as untested. Any
+        # gene missing a value already has a nan p-value, so this leaves a single
+        # mask of the rows to keep for every pair.
+        p_values[..., self._data[self.gene_name_col].isna().to_numpy()] = np.nan
 
-            output_path = self.output_dir / (
-                "_".join([group1_name, group2_name]) + "_de_analysis.xlsx"
-            )
+        group_index = {group: i for i, group in enumerate(self.groups)}
 
-            sig_genes = self._run_single_de_anaylsis(
-                group1_name,
-                group2_name,
-                fig_path,
-                output_path,
-            )
+        pairs = list(permutations(self.groups, 2))
+
+        def de_jobs():
+            for group1_name, group2_name in pairs:
+                fig_path = self.plot_dir / (
+                    "_".join([group1_name, group2_name]) + "_volcano.png"
+                )
+
+                self.de_paths[f"{group1_name}_{group2_name}"]["volcano_fig"] = fig_path
+
+                output_path = self.output_dir / (
+                    "_".join([group1_name, group2_name])
+                    + f"_de_analysis.{self.output_format}"
+                )
+
+                i, j = group_index[group1_name], group_index[group2_name]
+
+                grouped_data = self._run_single_de_anaylsis(
+                    group1_name,
+                    group2_name,
+                    log_fold_changes[i, j],
+                    p_values[i, j],
+                )
+
+                yield delayed(_save_single_de_analysis)(
+                    grouped_data,
+                    self.gene_name_col,
+                    self.p_value_threshold,
+                    self.log_fold_change_threshold,
+                    fig_path,
+                    output_path,
+                )
+
+        # Saving and plotting each pair is independent, so spread it over processes
+        all_sig_genes = Parallel(n_jobs=self.n_jobs)(tqdm(de_jobs(), total=len(pairs)))
 
+        # Pathway analysis queries Enrichr, so stays sequential
+        for (group1_name, group2_name), sig_genes in zip(pairs, all_sig_genes):
             if sig_genes:
                 fig_path = self.plot_dir / (
                     "_".join([group1_name, group2_name]) + "_pathways.png"
@@ -216,7 +341,8 @@ class AutoAnalysis:
                 self.de_paths[f"{group1_name}_{group2_name}"]["pathway_fig"] = fig_path
 
                 output_path = self.output_dir / (
-                    "_".join([group1_name, group2_name]) + "_pathways.xlsx"
+                    "_".join([group1_name, group2_name])
+                    + f"_pathways.{self.output_format}"
                 )
 
                 could_plot = self._run_pathway_analysis(
@@ -231,57 +357,105 @@ class AutoAnalysis:
             else:
                 self.de_paths[f"{group1_name}_{group2_name}"]["pathway_fig"] = None
 
+    def _run_batched_t_test(self) -> tp.Tuple[npt.NDArray, npt.NDArray]:
+        """Run an independent t-test between every pair of groups at once.
+
+        The statistics for every pair of groups are broadcast from the cached
+        per-group statistics, rather than re-reducing the data for each pair.
+
+        Returns:
+            tp.Tuple[npt.NDArray, npt.NDArray]: Log fold changes and p-values, each
+                of shape (n_groups, n_groups, n_genes) and indexed by the position
+                of the two groups in self.groups.
+        """
+        means, variances, counts = self._get_group_statistics()
+
+        mean = means[:, np.newaxis, :]
+        std = np.sqrt(variances)[:, np.newaxis, :]
+        n = counts[:, np.newaxis, np.newaxis]
+
+        # Pair every group (first axis) with every other group (second axis)
+        mean_1, mean_2 = mean, mean.transpose(1, 0, 2)
+        std_1, std_2 = std, std.transpose(1, 0, 2)
+        n_1, n_2 = n, n.transpose(1, 0, 2)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            _, p_values = ttest_ind_from_stats(
+                mean_1, std_1, n_1, mean_2, std_2, n_2, equal_var=True
+            )
+
+        return mean_1 - mean_2, p_values
+
+    def _get_group_statistics(
+        self,
+    ) -> tp.Tuple[npt.NDArray, npt.NDArray, npt.NDArray]:
+        """Get the per-gene mean, variance and sample count of every group.
+
+        These are reduced once and reused by every comparison until the data
+        changes.
+
+        Returns:
+            tp.Tuple[npt.NDArray, npt.NDArray, npt.NDArray]: Means and variances of
+                shape (n_groups, n_genes), and counts of shape (n_groups,), in the
+                order of self.groups.
+        """
+        if self._group_stats is None:
+            means, variances, counts = [], [], []
+            for group in self.groups:
+                idx = [self._col_index[col] for col in self._get_group_cols(group)]
+                group_values = self._values[:, idx]
+
+                means.append(group_values.mean(axis=1))
+                variances.append(group_values.var(axis=1, ddof=1))
+                counts.append(len(idx))
+
+            self._group_stats = (
+                np.stack(means),
+                np.stack(variances),
+                np.array(counts, dtype=np.float64),
+            )
+
+        return self._group_stats
+
     def _run_single_de_anaylsis(
-        self, group1_name: str, group2_name: str, fig_path: Path, output_path: Path
+        self,
+        group1_name: str,
+        group2_name: str,
+        log_fold_change: npt.NDArray,
+        p_value: npt.NDArray,
     ) -> pd.DataFrame:
-        """Run single differential expression analysis for two groups.
+        """Build the differential expression results for two groups.
 
         Args:
             group1_name (str): Column names of group 1
             group2_name (str): Column names of group 2
-            fig_path (Path): Path for figure to go into
-            output_path (Path): Path for output excel file to go into
+            log_fold_change (npt.NDArray): Log fold change of each gene between the groups
+            p_value (npt.NDArray): p-value of each gene between the groups
 
         Returns:
-            pd.DataFrame: _description_
+            pd.DataFrame: Gene names, group values, log fold changes and p-values.
         """
         group_1_cols = self._get_group_cols(group1_name)
         group_2_cols = self._get_group_cols(group2_name)
 
-        grouped_data = self.data.loc[
-            :, [self.gene_name_col] + group_1_cols + group_2_cols
-        ]
-
-        group_1_mean = self.data.loc[:, group_1_cols].mean(axis=1)
-        group_2_mean = self.data.loc[:, group_2_cols].mean(axis=1)
-
-        grouped_data["log_fold_change"] = group_1_mean - group_2_mean
-
-        grouped_data["p_value"] = ttest_ind(
-            self.data[group_1_cols], self.data[group_2_cols], axis=1
-        )[1]
+        group_cols = group_1_cols + group_2_cols
 
         # Drop na values
-        grouped_data = grouped_data.dropna()
-
-        # Save the data
-        grouped_data.to_excel(output_path)
-
-        # Plot the volcano plot
-        plots.VolcanoPlot(
-            grouped_data["log_fold_change"],
-            grouped_data["p_value"],
-            grouped_data[self.gene_name_col],
-            p_value_threshold=self.p_value_threshold,
-            log_fold_change_threshold=self.log_fold_change_threshold,
-            output_file=fig_path,
-        ).plot()
-
-        # Return significant genes
-        return grouped_data.loc[
-            (grouped_data["p_value"] < self.p_value_threshold)
-            & (grouped_data["log_fold_change"].abs() > self.log_fold_change_threshold)
-        ][self.gene_name_col].to_list()
+        rows = ~np.isnan(p_value)
+        group_values = self._values[
+            np.ix_(rows, [self._col_index[col] for col in group_cols])
+        ]
+
+        # Build the table in one go rather than adding columns one at a time
+        return pd.DataFrame(
+            {
+                self.gene_name_col: self._data[self.gene_name_col].to_numpy()[rows],
+                **dict(zip(group_cols, group_values.T)),
+                "log_fold_change": log_fold_change[rows],
+                "p_value": p_value[rows],
+            },
+            index=self._data.index[rows],
+        )
 
     def _run_pathway_analysis(
         self,
@@ -294,17 +468,12 @@ class AutoAnalysis:
         Args:
             significant_genes (tp.List[str]): List of significant genes.
             figure_path (Path): Path for figure to go into
-            output_path (Path): Path for output excel file to go into
+            output_path (Path): Path for output table to go into
         """
 
-        enriched = gp.enrichr(
-            gene_list=significant_genes,
-            organism=self.organism,
-            gene_sets=self.gene_sets,
-            cutoff=0.5,
-        )
+        enriched = self._get_enrichr_results(significant_genes)
 
-        enriched.results.to_excel(output_path)
+        self.save_data(enriched, output_path)
 
         try:
             plots.PathwayBarPlot(
@@ -318,6 +487,66 @@ class AutoAnalysis:
             print("Could not plot pathway bar plot.")
             return False
 
+    def _get_enrichr_results(self, significant_genes: tp.List[str]) -> pd.DataFrame:
+        """Get the Enrichr pathway enrichment for a list of genes.
+
+        Enrichr is queried over the network, so results are cached as CSV files in
+        the output directory and reused when the same genes, organism and gene
+        sets are looked up again. Cached results older than enrichr_cache_days are
+        ignored, so updates to the Enrichr libraries are picked up, as are ones
+        that can't be read back, and clear_enrichr_cache removes them all.
+
+        Args:
+            significant_genes (tp.List[str]): List of significant genes.
+
+        Returns:
+            pd.DataFrame: Enrichment results.
+        """
+        query = json.dumps([sorted(significant_genes), self.organism, self.gene_sets])
+        cache_path = self._enrichr_cache_dir() / (
+            hashlib.sha1(query.encode()).hexdigest() + ".csv"
+        )
+
+        max_age = self.enrichr_cache_days * 24 * 60 * 60
+        if cache_path.exists() and time.time() - cache_path.stat().st_mtime < max_age:
+            try:
+                return pd.read_csv(cache_path)
+            except (OSError, ValueError):
+                # A damaged copy is replaced by a fresh query below
+                pass
+
+        enriched = gp.enrichr(
+            gene_list=significant_genes,
+            organism=self.organism,
+            gene_sets=self.gene_sets,
+            cutoff=0.5,
+        )
+
+        if self.enrichr_cache_days > 0:
+            cache_path.parent.mkdir(exist_ok=True)
+
+            # Write next to the final path and move it into place, so an
+            # interrupted write never leaves a partial copy behind
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent, prefix=f".{cache_path.name}.", delete=False
+            ) as tmp_file:
+                tmp_path = Path(tmp_file.name)
+
+            try:
+                enriched.results.to_csv(tmp_path, index=False)
+                os.replace(tmp_path, cache_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+
+        return enriched.results
+
+    def clear_enrichr_cache(self) -> None:
+        """Delete all cached Enrichr results in the output directory."""
+        shutil.rmtree(self._enrichr_cache_dir(), ignore_errors=True)
+
+    def _enrichr_cache_dir(self) -> Path:
+        return self.output_dir / ".enrichr_cache"
+
     def _get_group_cols(self, group_name: tp.Union[tp.List[str], str]) -> tp.List[str]:
         """Get the columns for a group.
 
@@ -328,14 +557,13 @@ class AutoAnalysis:
             tp.List[str]: List of columns for the group.
         """
         if isinstance(group_name, str):
-            return self.data.columns[
-                self.data.columns.str.contains(group_name)
-            ].to_list()
+            return list(self._group_cols[group_name])
 
         else:
-            return self.data.columns[
-                self.data.columns.str.contains("|".join(group_name))
-            ].to_list()
+            group_cols = {
+                col for group in group_name for col in self._group_cols[group]
+            }
+            return self._data.columns[self._data.columns.isin(group_cols)].to_list()
 
     def _calculate_missing_data(self) -> float:
         """Calculate the percentage of zeros in the dataset.
@@ -343,15 +571,58 @@ class AutoAnalysis:
         Returns:
             float: Percentage of zeros in the dataset.
         """
-        cols = self._get_group_cols(self.groups)
-        num_zeros = (self.data.loc[:, cols] == 0).astype(int).sum().sum()
-        num_total = self.data.loc[:, cols].shape[0] * self.data.loc[:, cols].shape[1]
+        return np.count_nonzero(self._values == 0) / self._values.size * 100
+
+    def _queue_plot(self, plot: tp.Any) -> None:
+        """Render a plot, or queue it if the full pipeline is running.
+
+        Args:
+            plot (tp.Any): Plot object to render.
+        """
+        if self._deferred_plots is None:
+            plot.plot()
+        else:
+            self._deferred_plots.append(plot)
+
+    def _render_deferred_plots(self) -> None:
+        """Render all deferred plots in parallel and stop deferring new ones."""
+        deferred_plots, self._deferred_plots = self._deferred_plots or [], None
+
+        Parallel(n_jobs=self.n_jobs)(
+            delayed(_render_plot)(plot) for plot in deferred_plots
+        )
+
+    def _get_values(self, cols: tp.List[str]) -> pd.DataFrame:
+        """Get the current values of data columns.
+
+        Args:
+            cols (tp.List[str]): Data columns to get.
+
+        Returns:
+            pd.DataFrame: Values of the columns.
+        """
+        idx = [self._col_index[col] for col in cols]
+
+        return pd.DataFrame(self._values[:, idx], index=self._data.index, columns=cols)
 
-        return num_zeros / num_total * 100
+    def _set_values(self, cols: tp.List[str], values: tp.Any) -> None:
+        """Set the current values of data columns.
+
+        Args:
+            cols (tp.List[str]): Data columns to set.
+            values (tp.Any): New values, with one column per data column.
+        """
+        idx = [self._col_index[col] for col in cols]
+
+        self._values[:, idx] = np.asarray(values, dtype=np.float64)
+        self._array_changed = True
+
+        # The cached group statistics no longer match the data
+        self._group_stats = None
 
     def _save_data(self, output_file: Path) -> None:
-        """Save the data to an excel file."""
-        self.data.to_excel(self.output_dir / output_file)
+        """Save the data to the output directory."""
+        self.save_data(self.data, self.output_dir / output_file)
 
     def _check_dirs_exist(self) -> None:
         if not self.plot_dir.exists():
@@ -362,9 +633,10 @@ class AutoAnalysis:
 
     def _clean_gene_names(self) -> None:
         """Clean the gene names to remove version numbers."""
-        self.data[self.gene_name_col] = (
-            self.data[self.gene_name_col].str.split(";").str[0]
-        )
+        gene_names = self._data[self.gene_name_col]
+
+        # Partition stops at the first separator without building a list per row
+        self._data[self.gene_name_col] = gene_names.str.partition(";")[0]
 
     @staticmethod
     def load_data(data_path: Path) -> pd.DataFrame:
@@ -376,10 +648,136 @@ class AutoAnalysis:
         """
 
         if data_path.suffix == ".xlsx":
-            return pd.read_excel(data_path)
+            return AutoAnalysis._load_excel(data_path)
         elif data_path.suffix == ".csv":
             return pd.read_csv(data_path)
         elif data_path.suffix == ".tsv":
             return pd.read_csv(data_path, sep="\t")
         else:
             raise ValueError(f"File type {data_path.suffix} not supported.")
+
+    @staticmethod
+    def _load_excel(data_path: Path) -> pd.DataFrame:
+        """Load an excel file, keeping a parquet copy of it for later loads.
+
+        Parsing excel is slow, so the data is also saved as a parquet file in the
+        temporary directory, keyed on the path, size and modification time of the
+        excel file. Editing the excel file therefore misses the old copy, which is
+        deleted when the new one is written, so each workbook keeps at most one
+        copy. A copy that can't be read is ignored and the excel file is parsed.
+
+        Args:
+            data_path (Path): Path to excel file.
+        Returns:
+            pd.DataFrame: Data loaded from path.
+        """
+        stat = data_path.stat()
+        path_key = hashlib.md5(str(data_path.resolve()).encode()).hexdigest()
+        version_key = f"{stat.st_size}_{stat.st_mtime_ns}"
+
+        cache_dir = Path(tempfile.gettempdir())
+        cache_path = cache_dir / f"auto_bioinformatics_{path_key}_{version_key}.parquet"
+
+        if cache_path.exists():
+            try:
+                return pd.read_parquet(cache_path)
+            except (ImportError, OSError, ValueError):
+                # A damaged copy is rebuilt below
+                pass
+
+        data = pd.read_excel(data_path)
+
+        try:
+            for stale_path in cache_dir.glob(f"auto_bioinformatics_{path_key}_*"):
+                stale_path.unlink(missing_ok=True)
+
+            # Write next to the final path and move it into place, so an
+            # interrupted write never leaves a partial copy behind
+            with tempfile.NamedTemporaryFile(
+                dir=cache_dir, prefix=f".{cache_path.name}.", delete=False
+            ) as tmp_file:
+                tmp_path = Path(tmp_file.name)
+
+            try:
+                data.to_parquet(tmp_path, compression="zstd")
+                os.replace(tmp_path, cache_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        except (ImportError, OSError, TypeError, ValueError):
+            # The copy is only to speed up later loads, so carry on without it
+            pass
+
+        return data
+
+    @staticmethod
+    def save_data(data: pd.DataFrame, data_path: Path) -> None:
+        """Save data to a path, using the file type given by its suffix.
+
+        Args:
+            data (pd.DataFrame): Data to save.
+            data_path (Path): Path to data file.
+        """
+
+        if data_path.suffix == ".xlsx":
+            data.to_excel(data_path)
+        elif data_path.suffix == ".csv":
+            data.to_csv(data_path)
+        elif data_path.suffix == ".parquet":
+            data.to_parquet(data_path)
+        else:
+            raise ValueError(f"File type {data_path.suffix} not supported.")
+
+
+def _render_plot(plot: tp.Any) -> None:
+    """Render a plot, discarding its figure.
+
+    This is kept at module level so it can be sent to worker processes, and
+    returns nothing so the figure isn't pickled back to the parent.
+
+    Args:
+        plot (tp.Any): Plot object to render.
+    """
+    plot.plot()
+
+
+def _save_single_de_analysis(
+    grouped_data: pd.DataFrame,
+    gene_name_col: str,
+    p_value_threshold: float,
+    log_fold_change_threshold: float,
+    fig_path: Path,
+    output_path: Path,
+) -> tp.List[str]:
+    """Save and plot the differential expression results for two groups.
+
+    This is kept at module level so it can be sent to worker processes.
+
+    Args:
+        grouped_data (pd.DataFrame): Differential expression results for the groups.
+        gene_name_col (str): Column containing the gene names.
+        p_value_threshold (float): p-value threshold for significance.
+        log_fold_change_threshold (float): Log fold change threshold for significance.
+        fig_path (Path): Path for figure to go into
+        output_path (Path): Path for output table to go into
+
+    Returns:
+        tp.List[str]: Names of the significant genes.
+    """
+    # Save the data
+    AutoAnalysis.save_data(grouped_data, output_path)
+
+    # Plot the volcano plot
+    plots.VolcanoPlot(
+        grouped_data["log_fold_change"],
+        grouped_data["p_value"],
+        grouped_data[gene_name_col],
+        p_value_threshold=p_value_threshold,
+        log_fold_change_threshold=log_fold_change_threshold,
+        output_file=fig_path,
+    ).plot()
+
+    # Return significant genes
+    return grouped_data.loc[
+        (grouped_data["p_value"] < p_value_threshold)
+        & (grouped_data["log_fold_change"].abs() > log_fold_change_threshold)
+    ][gene_name_col].to_list()
@@ -6,12 +6,20 @@ preprocessing stage of an analysis.
 """
 
 import typing as tp
+import warnings
 from abc import ABC, abstractmethod
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.decomposition import PCA
 from sklearn.impute import KNNImputer, SimpleImputer
 
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
 
 class Imputer(ABC):
     """Abstract base class for imputers."""
@@ -65,32 +73,197 @@ class MeanImputer(Imputer):
 class KNN_Imputer(Imputer):
     """KNN imputer."""
 
-    def __init__(self, sample_threshold: float = 0.5):
-        """Initialise the KNN imputer."""
+    def __init__(
+        self,
+        sample_threshold: float = 0.5,
+        n_neighbors: int = 5,
+        approximate: bool = False,
+        n_components: tp.Optional[int] = None,
+        n_jobs: int = -1,
+    ):
+        """Initialise the KNN imputer.
+
+        Args:
+            sample_threshold (float, optional): Fraction of samples a row needs to be imputed. Defaults to 0.5.
+            n_neighbors (int, optional): Number of neighbours to impute from. Defaults to 5.
+            approximate (bool, optional): Find neighbours with an approximate HNSW index, which is much faster on large datasets. Requires faiss. Defaults to False.
+            n_components (tp.Optional[int], optional): Search for approximate neighbours among this many principal components rather than every sample, which is faster for data with many samples. Only used if approximate is True. Defaults to None.
+            n_jobs (int, optional): Number of threads to impute with, -1 uses all cores. Defaults to -1.
+        """
         super().__init__()
         self.sample_threshold = sample_threshold
+        self.n_neighbors = n_neighbors
+        self.approximate = approximate
+        self.n_components = n_components
+        self.n_jobs = n_jobs
 
     def fit(self, data: tp.Any) -> None:
         """Fit the imputer to the data."""
 
-        clean_data = data.replace(0, np.nan)
-        clean_data = clean_data.dropna(thresh=self.sample_threshold * data.shape[1])
-        self.imputer = KNNImputer()
-        self.imputer.fit(clean_data)
+        values, keep = self._mask_and_filter(data)
+        self._fit_clean(values[keep])
 
-    def transform(self, data: tp.Any) -> pd.DataFrame:
-        """Transform the data."""
-        clean_data = data.replace(0, np.nan)
-        clean_data = clean_data.dropna(
-            thresh=self.sample_threshold * clean_data.shape[1]
+    def fit_transform(self, data: tp.Any) -> pd.DataFrame:
+        """Fit and transform the data, only cleaning it once."""
+        values, keep = self._mask_and_filter(data)
+        clean_data = values[keep]
+
+        self._fit_clean(clean_data)
+
+        return self._impute(data, clean_data, keep)
+
+    def _fit_clean(self, clean_data: np.ndarray) -> None:
+        """Fit the imputer to data that has already been cleaned."""
+        if self.approximate and faiss is None:
+            warnings.warn("faiss is not installed, using exact KNN imputation.")
+
+        if self.approximate and faiss is not None:
+            self._fit_index(clean_data)
+        else:
+            # Kept as float64, as float32 distances are barely faster here and
+            # round enough to change which neighbours are picked
+            self.imputer = KNNImputer(n_neighbors=self.n_neighbors)
+            self.imputer.fit(clean_data)
+
+    def _mask_and_filter(self, data: tp.Any) -> tp.Tuple[np.ndarray, np.ndarray]:
+        """Mark zeros as missing and find the rows with enough samples to impute.
+
+        Args:
+            data (tp.Any): Data to clean.
+
+        Returns:
+            tp.Tuple[np.ndarray, np.ndarray]: Values with zeros set to nan, and a mask
+                of the rows to impute.
+        """
+        values = np.array(data, dtype=float)
+        np.copyto(values, np.nan, where=values == 0)
+
+        observed = np.count_nonzero(~np.isnan(values), axis=1)
+        keep = observed >= self.sample_threshold * values.shape[1]
+
+        return values, keep
+
+    def _fit_index(self, clean_data: np.ndarray) -> None:
+        """Build an approximate nearest neighbour index of the complete rows."""
+        self.imputer = None
+        complete_rows = ~np.isnan(clean_data).any(axis=1)
+        self.complete = clean_data[complete_rows].astype(np.float32)
+
+        if not len(self.complete):
+            raise ValueError(
+                "Approximate KNN imputation needs at least one complete row."
+            )
+
+        # Neighbours are searched for in the projection, but imputed from the
+        # complete rows themselves
+        self.projection = None
+        if self.n_components and self.n_components < self.complete.shape[1]:
+            self.projection = PCA(
+                n_components=min(self.n_components, len(self.complete)),
+                svd_solver="randomized",
+                random_state=0,
+            ).fit(self.complete)
+
+        searchable = self._project(self.complete)
+
+        self.index = faiss.IndexHNSWFlat(searchable.shape[1], 32)
+        self.index.add(searchable)
+
+    def _project(self, values: np.ndarray) -> np.ndarray:
+        """Project rows into the space the approximate index searches."""
+        if self.projection is not None:
+            values = self.projection.transform(values)
+
+        return np.ascontiguousarray(values, dtype=np.float32)
+
+    def _impute_from_index(self, values: np.ndarray) -> np.ndarray:
+        """Impute missing values from the mean of their nearest complete rows.
+
+        Only the search is done in float32, observed values are returned unchanged.
+        """
+        values = values.copy()
+        missing = np.isnan(values)
+        rows = np.flatnonzero(missing.any(axis=1))
+
+        # Fill the gaps with each row's own mean so incomplete rows can be searched
+        # for, as replicates of a gene are closer to each other than to other genes
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            row_means = np.nanmean(values[rows], axis=1, keepdims=True)
+
+        query = np.where(missing[rows], row_means, values[rows])
+
+        # Rows with nothing observed can only be placed at the centre of the data
+        query = np.where(np.isnan(query), self.complete.mean(axis=0), query)
+
+        _, neighbours = self.index.search(
+            self._project(query), min(self.n_neighbors, len(self.complete))
         )
-        clean_data = pd.DataFrame(
-            self.imputer.transform(clean_data),
-            columns=clean_data.columns,
-            index=clean_data.index,
+
+        values[rows] = np.where(
+            missing[rows], self.complete[neighbours].mean(axis=1), values[rows]
         )
 
-        return clean_data.reindex(data.index, fill_value=np.nan)
+        return values
+
+    def _transform_in_chunks(
+        self, values: np.ndarray, out: np.ndarray, positions: np.ndarray
+    ) -> None:
+        """Impute the incomplete rows in chunks across threads.
+
+        Each row is imputed from the fitted data alone, so the chunks give the
+        same result as imputing every row at once.
+
+        Args:
+            values (np.ndarray): Rows to impute, with missing values as nan.
+            out (np.ndarray): Array the imputed rows are written into.
+            positions (np.ndarray): Row of out for each row of values.
+        """
+        rows = np.flatnonzero(np.isnan(values).any(axis=1))
+
+        chunks = [
+            chunk
+            for chunk in np.array_split(rows, effective_n_jobs(self.n_jobs))
+            if len(chunk)
+        ]
+
+        imputed_chunks = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(self.imputer.transform)(values[chunk]) for chunk in chunks
+        )
+
+        for chunk, imputed in zip(chunks, imputed_chunks):
+            out[positions[chunk]] = imputed
+
+    def transform(self, data: tp.Any) -> pd.DataFrame:
+        """Transform the data."""
+        values, keep = self._mask_and_filter(data)
+
+        return self._impute(data, values[keep], keep)
+
+    def _impute(
+        self, data: tp.Any, clean_data: np.ndarray, keep: np.ndarray
+    ) -> pd.DataFrame:
+        """Impute cleaned data, leaving the rows that were filtered out as nan.
+
+        Args:
+            data (tp.Any): Original data.
+            clean_data (np.ndarray): Kept rows of the data, with zeros set to nan.
+            keep (np.ndarray): Mask of the kept rows.
+
+        Returns:
+            pd.DataFrame: Imputed data.
+        """
+        # Write straight into the full sized output, leaving filtered rows as nan
+        imputed = np.full(np.shape(data), np.nan)
+        positions = np.flatnonzero(keep)
+
+        if self.imputer is None:
+            imputed[positions] = self._impute_from_index(clean_data)
+        else:
+            imputed[positions] = clean_data
+            self._transform_in_chunks(clean_data, imputed, positions)
+
+        return pd.DataFrame(imputed, index=data.index, columns=data.columns)
 
     def __str__(self) -> str:
         """Generate a string representation of the imputer."""
@@ -2,12 +2,13 @@
 
 import argparse
 from pathlib import Path
-from auto_bioinformatics.ui.root import run_ui
-from auto_bioinformatics.analysis import AutoAnalysis
 
 
 def run_with_cli(args: argparse.Namespace) -> None:
     """Run the program with a CLI interface."""
+    # Imported here so argument parsing doesn't wait on pandas, scipy and gseapy
+    from auto_bioinformatics.analysis import AutoAnalysis
+
     print("Running with CLI interface.")
 
     data = AutoAnalysis.load_data(Path(args.data))
@@ -36,6 +37,9 @@ def run_with_cli(args: argparse.Namespace) -> None:
 
 def run_with_ui(args: argparse.Namespace) -> None:
     """Run the program with a GUI interface."""
+    # Imported here so CLI runs don't load tkinter
+    from auto_bioinformatics.ui.root import run_ui
+
     print("Running with GUI interface.")
     run_ui()
 
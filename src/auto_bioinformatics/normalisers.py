@@ -7,6 +7,7 @@ algorithms require data to be scaled to a mean of 0 and variance of 1.
 
 from abc import ABC, abstractmethod
 import numpy as np
+import pandas as pd
 import typing as tp
 from sklearn.preprocessing import PowerTransformer
 
@@ -47,9 +48,13 @@ class StandardScaler(Normaliser):
         super().__init__()
 
     def fit(self, data: tp.Any) -> None:
-        """Fit the scaler to the data."""
-        self.mean = np.mean(data)
-        self.std = np.std(data)
+        """Fit the scaler to the data, with a mean and deviation per column."""
+        values = np.asarray(data, dtype=float)
+        self.mean = np.nanmean(values, axis=0)
+        std = np.nanstd(values, axis=0)
+
+        # Constant columns are left unscaled rather than divided by zero
+        self.std = np.where(std == 0, 1, std)
 
     def transform(self, data: tp.Any) -> tp.Any:
         """Transform the data."""
@@ -68,13 +73,18 @@ class MinMaxScaler(Normaliser):
         super().__init__()
 
     def fit(self, data: tp.Any) -> None:
-        """Figt the scaler to the data."""
-        self.min = np.min(data)
-        self.max = np.max(data)
+        """Fit the scaler to the data, with a range per column."""
+        values = np.asarray(data, dtype=float)
+        self.min = np.nanmin(values, axis=0)
+        self.max = np.nanmax(values, axis=0)
+
+        # Constant columns are left unscaled rather than divided by zero
+        value_range = self.max - self.min
+        self.range = np.where(value_range == 0, 1, value_range)
 
     def transform(self, data: tp.Any) -> tp.Any:
         """Transform the data."""
-        return (data - self.min) / (self.max - self.min)
+        return (data - self.min) / self.range
 
     def __str__(self) -> str:
         """Generate a string representation of the object."""
@@ -84,12 +94,27 @@ class MinMaxScaler(Normaliser):
 class PowerScaler(Normaliser):
     """Power scaling scales the data to a normal distribution."""
 
-    def __init__(self) -> None:
-        """Initialise the power scaler."""
+    def __init__(self, sample_size: int = 5000) -> None:
+        """Initialise the power scaler.
+
+        Args:
+            sample_size (int, optional): Maximum number of rows to fit the transform on. Defaults to 5000.
+        """
         super().__init__()
+        self.sample_size = sample_size
 
     def fit(self, data: tp.Any) -> None:
-        """Fit the scaler to the data."""
+        """Fit the scaler to the data.
+
+        Finding the power transform parameters is costly, so larger datasets are
+        fitted on a fixed random sample of rows.
+        """
+        if len(data) > self.sample_size:
+            rows = np.random.default_rng(0).choice(
+                len(data), size=self.sample_size, replace=False
+            )
+            data = data.iloc[rows] if isinstance(data, pd.DataFrame) else data[rows]
+
         self.transformer = PowerTransformer()
         self.transformer.fit(data)
 
@@ -4,15 +4,19 @@ import typing as tp
 from pathlib import Path
 
 import gseapy as gp
-import matplotlib.pyplot as plt
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
 from adjustText import adjust_text
+from matplotlib.figure import Figure
 
 import auto_bioinformatics.reducers as reducers
 from auto_bioinformatics.errors import PlottingError
 
+# Figures are built directly rather than through pyplot, so they are drawn with
+# the Agg renderer without starting an interactive backend
+DPI = 100
+
 
 class VolcanoPlot:
     """Volcano plot for visualizing differential expression analysis results."""
@@ -25,6 +29,7 @@ class VolcanoPlot:
         log_fold_change_threshold: float = 1,
         p_value_threshold: float = 0.05,
         output_file: tp.Optional[Path] = None,
+        max_labels: tp.Optional[int] = 50,
     ) -> None:
         """Initialize a VolcanoPlot object.
 
@@ -35,6 +40,7 @@ class VolcanoPlot:
             log_fold_change_threshold (float, optional): Log fold change threshold for significance. Defaults to 1.
             p_value_threshold (float, optional): P-Value threshold for significance. Defaults to 0.05.
             output_file (Path, optional): Path to save the plot to. Defaults to None.
+            max_labels (tp.Optional[int], optional): Most significant points to label, None labels them all. Defaults to 50.
         """
         self.log_fold_changes = log_fold_changes
         self.p_values = p_values
@@ -43,6 +49,7 @@ class VolcanoPlot:
         self.log_fold_change_threshold = log_fold_change_threshold
         self.p_value_threshold = p_value_threshold
         self.output_file = output_file
+        self.max_labels = max_labels
 
     def plot(self):
         """Plot the volcano plot."""
@@ -51,32 +58,45 @@ class VolcanoPlot:
                 "The shape of the log fold changes and p-values must be the same."
             )
 
-        fig, ax = plt.subplots(figsize=(10, 10))
+        log_fold_changes = np.asarray(self.log_fold_changes)
+        neg_log_p = -np.log10(np.asarray(self.p_values))
+        abs_log_fold_changes = np.abs(log_fold_changes)
+        labels = np.asarray(self.labels)
+
+        fig = Figure(figsize=(10, 10))
+        ax = fig.subplots()
 
         ax.scatter(
-            self.log_fold_changes, -np.log10(self.p_values), c=-np.log10(self.p_values)
+            log_fold_changes, neg_log_p, c=neg_log_p, linewidths=0, rasterized=True
         )
 
         # Add labels for significant points
-        texts = []
-        for label, x, y in zip(
-            self.labels, self.log_fold_changes, -np.log10(self.p_values)
-        ):
-            if (
-                y > -np.log10(self.p_value_threshold)
-                and abs(x) > self.log_fold_change_threshold
-            ):
-                texts.append(ax.text(x, y, label, fontsize=12))
+        significant = np.flatnonzero(
+            (neg_log_p > -np.log10(self.p_value_threshold))
+            & (abs_log_fold_changes > self.log_fold_change_threshold)
+        )
+
+        # Only label the most extreme points, as placing labels scales badly
+        if self.max_labels is not None and len(significant) > self.max_labels:
+            score = abs_log_fold_changes[significant] * neg_log_p[significant]
+            top = np.argpartition(-score, self.max_labels - 1)[: self.max_labels]
+            significant = significant[np.sort(top)]
+
+        texts = [
+            ax.text(log_fold_changes[i], neg_log_p[i], labels[i], fontsize=12)
+            for i in significant
+        ]
 
         # Adjust the labels so they don't overlap
-        adjust_text(texts, arrowprops=dict(arrowstyle="-", color="k", lw=0.5))
+        adjust_text(texts, ax=ax, arrowprops=dict(arrowstyle="-", color="k", lw=0.5))
 
         # Add axis labels and title
         ax.set_xlabel("Log Fold Change")
         ax.set_ylabel("-log10(p-value)")
 
         # Set the x-axis to be symmetrical around 0
-        ax.set_xlim(-max(abs(self.log_fold_changes)), max(abs(self.log_fold_changes)))
+        max_log_fold_change = abs_log_fold_changes.max()
+        ax.set_xlim(-max_log_fold_change, max_log_fold_change)
 
         # Add horizontal lines at the significance thresholds
 
@@ -91,11 +111,11 @@ class VolcanoPlot:
         ax.spines["top"].set_visible(False)
         ax.spines["right"].set_visible(False)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save the plot if an output file is specified
         if self.output_file:
-            fig.savefig(self.output_file)
+            fig.savefig(self.output_file, dpi=DPI)
 
         return fig
 
@@ -121,35 +141,45 @@ class ImputationPlot:
         n_samples = min(self.pre_imputed_data.shape[1], 4)
 
         # Create a figure with a subplot for each sample
-        fig, axes = plt.subplots(n_samples, 2, figsize=(10, 3 * n_samples))
+        fig = Figure(figsize=(10, 3 * n_samples))
+        axes = fig.subplots(n_samples, 2, squeeze=False)
+
+        pre = self.pre_imputed_data.to_numpy(copy=False)[:, :n_samples]
+        post = self.post_imputed_data.to_numpy(copy=False)[:, :n_samples]
+
+        # Zeros in the pre-imputed data are missing values, so only the observed
+        # values and the imputed differences are plotted
+        observed = pre != 0
+        difference = post - pre
+        imputed = difference != 0
+
+        # Share one set of bin edges between every subplot
+        plotted = np.concatenate([pre[observed], difference[imputed]])
+        if plotted.size:
+            bins = np.linspace(np.nanmin(plotted), np.nanmax(plotted), 101)
+        else:
+            bins = np.linspace(0, 1, 101)
 
-        # Plot the pre-imputed data
         for i in range(n_samples):
-            filtered_pre = self.pre_imputed_data.iloc[:, i][
-                self.pre_imputed_data.iloc[:, i] != 0
-            ]
+            pre_counts, _ = np.histogram(pre[observed[:, i], i], bins=bins)
+            imputed_counts, _ = np.histogram(difference[imputed[:, i], i], bins=bins)
 
-            axes[i, 0].hist(filtered_pre, bins=100)
+            # Plot the pre-imputed data
+            axes[i, 0].stairs(pre_counts, bins, fill=True)
             axes[i, 0].set_title(f"Sample {i+1}")
 
-            # Calculate the difference between the pre and post imputed data
-            difference = (
-                self.post_imputed_data.iloc[:, i] - self.pre_imputed_data.iloc[:, i]
-            )
-
-            # Plot the difference
-            axes[i, 1].hist(
-                [filtered_pre, difference[difference != 0]], bins=100, stacked=True
-            )
+            # Plot the imputed values stacked on top of the pre-imputed data
+            axes[i, 1].stairs(pre_counts + imputed_counts, bins, fill=True, color="C1")
+            axes[i, 1].stairs(pre_counts, bins, fill=True, color="C0")
 
             # Add a title
             axes[i, 1].set_title(f"Sample {i+1}")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save the plot if an output file is specified
         if self.output_file:
-            fig.savefig(self.output_file)
+            fig.savefig(self.output_file, dpi=DPI)
 
         return fig
 
@@ -166,8 +196,10 @@ class ProjectionPlot:
         groups: tp.Optional[tp.List[str]] = None,
     ) -> None:
         """Initialize a ProjectionPlot object."""
-        self.points = points
+        # A contiguous float32 copy is cheap to slice and to send to plot workers
+        self.points = np.ascontiguousarray(points, dtype=np.float32)
         self.projection = projection
+        self.title = f"{projection} Projection"
         self.output_file = output_file
         self.cols = cols
         self.groups = groups
@@ -175,7 +207,8 @@ class ProjectionPlot:
     def plot(self):
         """Plot the projection."""
         # Create a figure
-        fig, ax = plt.subplots(figsize=(10, 10))
+        fig = Figure(figsize=(10, 10))
+        ax = fig.subplots()
 
         # Plot the points
 
@@ -183,23 +216,33 @@ class ProjectionPlot:
             for group in self.groups:
                 rows = [i for i, x in enumerate(self.cols) if group in x]
 
-                ax.scatter(self.points[rows, 0], self.points[rows, 1], label=group)
+                ax.scatter(
+                    *self.points[rows, :2].T,
+                    label=group,
+                    linewidths=0,
+                    rasterized=True,
+                )
         else:
-            ax.scatter(self.points[:, 0], self.points[:, 1], c="black")
+            ax.scatter(
+                *self.points[:, :2].T,
+                c="black",
+                linewidths=0,
+                rasterized=True,
+            )
 
         # Add axis labels and title
         ax.set_xlabel("Dimension 1")
         ax.set_ylabel("Dimension 2")
-        ax.set_title(f"{self.projection} Projection")
+        ax.set_title(self.title)
 
         if self.groups:
             ax.legend()
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save the plot if an output file is specified
         if self.output_file:
-            fig.savefig(self.output_file)
+            fig.savefig(self.output_file, dpi=DPI)
 
         return fig
 
@@ -207,24 +250,24 @@ class ProjectionPlot:
 class PathwayBarPlot:
     """Pathway bar plot for visualizing pathway analysis results."""
 
-    def __init__(self, enrich: gp.Enrichr, **kwargs) -> None:
+    def __init__(self, enrich: pd.DataFrame, **kwargs) -> None:
         """Initialize a PathwayBarPlot object."""
         self.enrich = enrich
         self.barplot_kwargs = kwargs
 
     def plot(self):
         """Plot the pathway bar plot."""
-        gp.barplot(self.enrich.results, **self.barplot_kwargs)
+        gp.barplot(self.enrich, **self.barplot_kwargs)
 
 
 class PathwayDotPlot:
     """Pathway dot plot for visualizing pathway analysis results."""
 
-    def __init__(self, enrich: gp.Enrichr, **kwargs) -> None:
+    def __init__(self, enrich: pd.DataFrame, **kwargs) -> None:
         """Initialize a PathwayDotPlot object."""
         self.enrich = enrich
         self.dotplot_kwargs = kwargs
 
     def plot(self):
         """Plot the pathway dot plot."""
-        gp.dotplot(self.enrich.results, **self.dotplot_kwargs)
+        gp.dotplot(self.enrich, **self.dotplot_kwargs)
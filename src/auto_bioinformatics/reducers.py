@@ -40,13 +40,26 @@ class Reducer(ABC):
 class PCA(Reducer):
     """Principal component analysis (PCA) reducer."""
 
-    def __init__(self) -> None:
-        """Initialise the PCA reducer."""
+    def __init__(self, n_components: int = 10) -> None:
+        """Initialise the PCA reducer.
+
+        Args:
+            n_components (int, optional): Maximum number of components to keep. Defaults to 10.
+        """
         super().__init__()
+        self.n_components = n_components
 
     def fit(self, data: tp.Any) -> None:
-        """Fit the reducer to the data."""
-        self.pca = decomposition.PCA()
+        """Fit the reducer to the data.
+
+        Only the leading components are needed, so a randomised SVD is used
+        rather than a full decomposition.
+        """
+        self.pca = decomposition.PCA(
+            n_components=min(self.n_components, *data.shape),
+            svd_solver="randomized",
+            random_state=0,
+        )
         self.pca.fit(data.T)
 
     def transform(self, data: tp.Any) -> tp.Any:
@@ -1,5 +1,6 @@
 """Automatic generation of reports for automatic analysis."""
 
+import typing as tp
 from itertools import permutations
 from pathlib import Path
 
@@ -15,23 +16,29 @@ class Reporter:
         self,
         analysis: AutoAnalysis,
         name: str = "Unnamed Report",
-        output_path: Path = Path("out/report.docx"),
+        output_path: tp.Union[str, Path] = Path("out/report.docx"),
     ) -> None:
         """Initialise a Reporter object.
 
         Args:
             analysis (AutoAnalysis): Completed AutoAnalysis object.
             name (str, optional): Name of the report/experiment. Defaults to "Unnamed Report".
-            output_path (Path, optional): Path to output report. Defaults to Path("out/report.docx").
+            output_path (tp.Union[str, Path], optional): Path to output report, its directory is created if needed. Defaults to Path("out/report.docx").
         """
         self.report = docx.Document()
         self.name = name
-        self.output_path = output_path
+        self.output_path = Path(output_path)
         self.analysis = analysis
 
+        # Make sure the output directory exists
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Heading style ids keyed by level, so each style is only looked up once
+        self._heading_style_ids: tp.Dict[int, str] = {}
+
     def generate_report(self) -> None:
         """Generate a full report for a given analysis."""
-        self.report.add_heading(f"AutoAnalysis Report for {self.name}", 0)
+        self._add_heading(f"AutoAnalysis Report for {self.name}", level=0)
 
         self._generate_premable()
 
@@ -49,13 +56,29 @@ class Reporter:
         if self.analysis.de_paths:
             self._generate_differential_expression_description()
 
-        # Make sure the output directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
-
         self.report.save(self.output_path)
 
+    def _add_heading(self, text: str, level: int = 1) -> None:
+        """Add a heading to the report.
+
+        docx.Document.add_heading searches the document styles by name on every
+        call, which dominates report generation for many groups. The style id is
+        looked up once per level and set on the paragraph directly instead.
+
+        Args:
+            text (str): Heading text.
+            level (int, optional): Heading level, 0 for the title. Defaults to 1.
+        """
+        style_id = self._heading_style_ids.get(level)
+        if style_id is None:
+            style_name = "Title" if level == 0 else f"Heading {level}"
+            style_id = self.report.styles[style_name].style_id
+            self._heading_style_ids[level] = style_id
+
+        self.report.add_paragraph(text)._p.style = style_id
+
     def _generate_premable(self) -> None:
-        self.report.add_heading("About This Document", level=1)
+        self._add_heading("About This Document", level=1)
 
         self.report.add_paragraph(
             "This document was automatically generated by AutoBioinformatics. All output files are available in the 'out' directory, and all plots are available in the 'img' directory."
@@ -66,7 +89,7 @@ class Reporter:
         )
 
     def _generate_data_description(self) -> None:
-        self.report.add_heading("Data Description", level=1)
+        self._add_heading("Data Description", level=1)
 
         num_groups = len(self.analysis.groups)
         self.report.add_paragraph(
@@ -85,7 +108,7 @@ class Reporter:
             self.report.add_paragraph(f"{self.analysis.scaler.explaination}")
 
     def _generate_imputation_description(self) -> None:
-        self.report.add_heading("Imputation", level=1)
+        self._add_heading("Imputation", level=1)
 
         self.report.add_paragraph(
             f"The data was imputed using {self.analysis.imputer}."
@@ -104,7 +127,7 @@ class Reporter:
             )
 
     def _generate_normalisation_description(self) -> None:
-        self.report.add_heading("Normalisation", level=1)
+        self._add_heading("Normalisation", level=1)
 
         self.report.add_paragraph(
             f"The data was normalised using {self.analysis.normaliser}."
@@ -114,7 +137,7 @@ class Reporter:
             self.report.add_paragraph(f"{self.analysis.normaliser.explaination}")
 
     def _generate_reducer_description(self) -> None:
-        self.report.add_heading("Dimensionality Reduction", level=1)
+        self._add_heading("Dimensionality Reduction", level=1)
 
         self.report.add_paragraph(
             f"The data was reduced using {self.analysis.reducer}."
@@ -133,7 +156,7 @@ class Reporter:
             )
 
     def _generate_differential_expression_description(self) -> None:
-        self.report.add_heading("Differential Expression", level=1)
+        self._add_heading("Differential Expression", level=1)
 
         self.report.add_paragraph(
             f"For each pair of groups, the fold change was calculated, and the p-value was calculated using a independent t-test."
@@ -148,7 +171,7 @@ class Reporter:
         )
 
         for group_a, group_b in permutations(self.analysis.groups, 2):
-            self.report.add_heading(
+            self._add_heading(
                 f"Differential Expression Between {group_a} and {group_b}", level=2
             )
 
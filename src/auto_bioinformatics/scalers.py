@@ -3,6 +3,27 @@
 import typing as tp
 from abc import ABC, abstractmethod
 import numpy as np
+import pandas as pd
+
+
+def _zero_safe_log(data: pd.DataFrame, log: np.ufunc) -> pd.DataFrame:
+    """Apply a log function to the data, leaving zeros (missing values) as zero.
+
+    Zeros are masked out of the log itself, so no -inf values are produced and
+    no second pass is needed to replace them.
+
+    Args:
+        data (pd.DataFrame): Data to scale.
+        log (np.ufunc): Log function to apply, e.g. np.log2.
+
+    Returns:
+        pd.DataFrame: Scaled data.
+    """
+    values = data.to_numpy(dtype=float)
+    scaled = np.zeros_like(values)
+    log(values, out=scaled, where=values != 0)
+
+    return pd.DataFrame(scaled, index=data.index, columns=data.columns)
 
 
 class Scaler(ABC):
@@ -46,7 +67,7 @@ class Log2Scaler(Scaler):
 
     def transform(self, data: tp.Any) -> tp.Any:
         """Transform the data using log2 scaling."""
-        return np.log2(data).replace(-np.inf, 0)
+        return _zero_safe_log(data, np.log2)
 
     def __str__(self) -> str:
         """Generate a string representation of the scaler."""
@@ -66,7 +87,7 @@ class Log10Scaler(Scaler):
 
     def transform(self, data: tp.Any) -> tp.Any:
         """Trasnform the data using log10 scaling."""
-        return np.log10(data).replace(-np.inf, 0)
+        return _zero_safe_log(data, np.log10)
 
     def __str__(self) -> str:
         """Generate a string representation of the scaler."""
@@ -86,7 +107,7 @@ class LogScaler(Scaler):
 
     def transform(self, data: tp.Any) -> tp.Any:
         """Transform the data using natural log scaling."""
-        return np.log(data).replace(-np.inf, 0)
+        return _zero_safe_log(data, np.log)
 
     def __str__(self) -> str:
         """Generate a string representation of the scaler."""
@@ -4,8 +4,6 @@ from pathlib import Path
 from tkinter import *
 from tkinter import filedialog
 
-import pandas as pd
-
 from auto_bioinformatics.analysis import AutoAnalysis
 from auto_bioinformatics.reporting import Reporter
 
@@ -96,7 +94,7 @@ class AutoBioinformaticsUI:
         output_dir = Path(self.output_path) / "out"
 
         cols = self.group_names.get().split(",")
-        data = pd.read_excel(Path(self.filepath))
+        data = AutoAnalysis.load_data(Path(self.filepath))
         gene_col = self.gene_col.get()
 
         analysis = AutoAnalysis(
@@ -0,0 +1,208 @@
+"""Tests for the AutoAnalysis pipeline."""
+
+import sys
+import tempfile
+from itertools import permutations
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+from scipy.stats import ttest_ind
+
+import auto_bioinformatics.analysis as analysis_module
+from auto_bioinformatics.analysis import AutoAnalysis
+
+GROUPS = ["Ctrl", "TreatA", "TreatB"]
+
+# The flat gene makes ttest_ind warn before returning nan
+pytestmark = pytest.mark.filterwarnings("ignore:Precision loss:RuntimeWarning")
+
+
+def make_data() -> pd.DataFrame:
+    """Make a small dataset with missing values, unnamed genes and a flat gene."""
+    rng = np.random.default_rng(0)
+
+    data = pd.DataFrame(
+        {
+            "Gene": [f"gene{i}" for i in range(30)],
+            **{
+                f"{group}_{i}": rng.normal(10 + g, 1, 30)
+                for g, group in enumerate(GROUPS)
+                for i in range(3)
+            },
+        }
+    )
+
+    data.loc[[2, 7], "TreatA_1"] = np.nan
+    data.loc[11, ["Ctrl_0", "Ctrl_1", "Ctrl_2"]] = np.nan
+    data.loc[[4, 19], "Gene"] = None
+    data.loc[23, data.columns[1:]] = 5.0
+
+    return data
+
+
+def reference_de(data: pd.DataFrame, group_1: str, group_2: str) -> pd.DataFrame:
+    """Differential expression computed with ttest_ind and dropna."""
+    group_1_cols = [col for col in data.columns if group_1 in col]
+    group_2_cols = [col for col in data.columns if group_2 in col]
+
+    grouped_data = data.loc[:, ["Gene"] + group_1_cols + group_2_cols]
+
+    grouped_data["log_fold_change"] = data[group_1_cols].mean(axis=1) - data[
+        group_2_cols
+    ].mean(axis=1)
+
+    grouped_data["p_value"] = ttest_ind(data[group_1_cols], data[group_2_cols], axis=1)[
+        1
+    ]
+
+    return grouped_data.dropna()
+
+
+def test_batched_t_test_matches_ttest_ind():
+    """Test the batched t-test gives the same statistics as ttest_ind."""
+    data = make_data()
+    analysis = AutoAnalysis(data.copy(), GROUPS)
+
+    log_fold_changes, p_values = analysis._run_batched_t_test()
+
+    for i, group_1 in enumerate(GROUPS):
+        for j, group_2 in enumerate(GROUPS):
+            if i == j:
+                continue
+
+            group_1_values = data[[c for c in data.columns if group_1 in c]]
+            group_2_values = data[[c for c in data.columns if group_2 in c]]
+
+            expected_p = ttest_ind(group_1_values, group_2_values, axis=1)[1]
+            expected_lfc = group_1_values.mean(axis=1) - group_2_values.mean(axis=1)
+
+            tested = ~np.isnan(expected_p)
+            np.testing.assert_array_equal(np.isnan(p_values[i, j]), ~tested)
+            np.testing.assert_allclose(
+                p_values[i, j, tested], expected_p[tested], rtol=1e-12
+            )
+            np.testing.assert_allclose(
+                log_fold_changes[i, j, tested], expected_lfc[tested], rtol=1e-12
+            )
+
+
+def test_single_de_analysis_matches_dropna():
+    """Test each comparison table matches ttest_ind followed by dropna."""
+    data = make_data()
+    analysis = AutoAnalysis(data.copy(), GROUPS)
+
+    log_fold_changes, p_values = analysis._run_batched_t_test()
+
+    # Unnamed genes are left out, as in _run_all_de_analysis
+    p_values[..., data["Gene"].isna().to_numpy()] = np.nan
+
+    for group_1, group_2 in permutations(GROUPS, 2):
+        i, j = GROUPS.index(group_1), GROUPS.index(group_2)
+
+        result = analysis._run_single_de_anaylsis(
+            group_1, group_2, log_fold_changes[i, j], p_values[i, j]
+        )
+        expected = reference_de(data, group_1, group_2)
+
+        assert 4 not in result.index and 19 not in result.index
+        assert 23 not in result.index
+        pdt.assert_frame_equal(result, expected, check_exact=False, rtol=1e-12)
+
+
+@pytest.mark.parametrize("output_format", ["xlsx", "csv", "parquet"])
+def test_save_data_round_trips(tmp_path, output_format):
+    """Test tables saved in each output format load back unchanged."""
+    if output_format == "parquet":
+        pytest.importorskip("pyarrow")
+
+    data = make_data().dropna().set_index("Gene")
+    path = tmp_path / f"table.{output_format}"
+
+    AutoAnalysis.save_data(data, path)
+
+    if output_format == "parquet":
+        loaded = pd.read_parquet(path)
+    else:
+        loaded = AutoAnalysis.load_data(path).set_index("Gene")
+
+    pdt.assert_frame_equal(loaded, data, check_exact=False, rtol=1e-12)
+
+
+def test_unsupported_output_format_raises():
+    """Test an unknown output format is rejected up front."""
+    with pytest.raises(ValueError):
+        AutoAnalysis(make_data(), GROUPS, output_format="json")
+
+
+def test_parquet_output_needs_pyarrow(monkeypatch):
+    """Test parquet output fails up front when pyarrow is missing."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="parquet"):
+        AutoAnalysis(make_data(), GROUPS, output_format="parquet")
+
+
+def test_stage_results_show_in_data():
+    """Test a stage run on its own updates data, and edits to data are used."""
+    data = make_data()
+    analysis = AutoAnalysis(data.copy(), GROUPS)
+
+    analysis._scale_data()
+
+    np.testing.assert_allclose(analysis.data["Ctrl_0"], np.log2(data["Ctrl_0"]))
+
+    analysis.data.loc[0, "Ctrl_0"] = 2.0
+    analysis._scale_data()
+
+    assert analysis.data.loc[0, "Ctrl_0"] == 1.0
+
+
+def test_damaged_excel_cache_is_rebuilt(tmp_path, monkeypatch):
+    """Test a truncated parquet copy of a workbook is ignored and replaced."""
+    pytest.importorskip("pyarrow")
+
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(cache_dir))
+
+    data = make_data().dropna().reset_index(drop=True)
+    path = tmp_path / "data.xlsx"
+    data.to_excel(path, index=False)
+
+    AutoAnalysis.load_data(path)
+    (cache_path,) = cache_dir.iterdir()
+    cache_path.write_bytes(cache_path.read_bytes()[:10])
+
+    loaded = AutoAnalysis.load_data(path)
+
+    pdt.assert_frame_equal(loaded, data, check_exact=False)
+    assert list(cache_dir.iterdir()) == [cache_path]
+    pdt.assert_frame_equal(pd.read_parquet(cache_path), loaded)
+
+
+def test_damaged_enrichr_cache_is_requeried(tmp_path, monkeypatch):
+    """Test an unreadable cached Enrichr result is looked up again and replaced."""
+    results = pd.DataFrame({"Term": ["a", "b"], "P-value": [0.01, 0.2]})
+    calls = []
+
+    def enrichr(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(results=results)
+
+    monkeypatch.setattr(analysis_module.gp, "enrichr", enrichr)
+
+    analysis = AutoAnalysis(make_data(), GROUPS, output_dir=tmp_path)
+    analysis._get_enrichr_results(["gene1", "gene2"])
+
+    (cache_path,) = analysis._enrichr_cache_dir().iterdir()
+    cache_path.write_bytes(b"")
+
+    pdt.assert_frame_equal(analysis._get_enrichr_results(["gene1", "gene2"]), results)
+    assert len(calls) == 2
+    assert list(analysis._enrichr_cache_dir().iterdir()) == [cache_path]
+
+    pdt.assert_frame_equal(analysis._get_enrichr_results(["gene1", "gene2"]), results)
+    assert len(calls) == 2
@@ -0,0 +1,82 @@
+"""Tests for the imputers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from auto_bioinformatics import imputers
+
+
+def make_data(n_rows: int = 2000, n_cols: int = 5, missing: float = 0.1):
+    """Make correlated data with zeros marking missing values.
+
+    Returns:
+        The full data, and the same data with zeros in place of missing values.
+    """
+    rng = np.random.default_rng(0)
+    full = rng.normal(10, 2, (n_rows, 1)) + rng.normal(0, 0.3, (n_rows, n_cols))
+    with_missing = np.where(rng.random(full.shape) < missing, 0, full)
+
+    return full, pd.DataFrame(with_missing)
+
+
+def test_approximate_imputation_is_close_to_exact():
+    """Test approximate imputation fills the same cells about as well as exact."""
+    pytest.importorskip("faiss")
+
+    full, data = make_data()
+    missing = data.to_numpy() == 0
+
+    exact = imputers.KNN_Imputer().fit_transform(data).to_numpy()
+    approximate = imputers.KNN_Imputer(approximate=True).fit_transform(data)
+    approximate = approximate.to_numpy()
+
+    # Rows without enough samples are left out in both
+    np.testing.assert_array_equal(np.isnan(approximate), np.isnan(exact))
+
+    # Observed values are returned unchanged
+    observed = ~missing & ~np.isnan(approximate)
+    np.testing.assert_array_equal(approximate[observed], full[observed])
+
+    imputed = missing & ~np.isnan(approximate)
+    exact_error = np.abs(exact[imputed] - full[imputed]).mean()
+    approximate_error = np.abs(approximate[imputed] - full[imputed]).mean()
+
+    assert approximate_error < 1.5 * exact_error
+
+
+def test_approximate_without_faiss_falls_back_to_exact(monkeypatch):
+    """Test asking for approximate imputation without faiss warns and uses exact."""
+    monkeypatch.setattr(imputers, "faiss", None)
+
+    _, data = make_data(n_rows=200)
+
+    with pytest.warns(UserWarning, match="faiss"):
+        approximate = imputers.KNN_Imputer(approximate=True).fit_transform(data)
+
+    exact = imputers.KNN_Imputer().fit_transform(data)
+
+    pd.testing.assert_frame_equal(approximate, exact)
+
+
+def test_projected_search_matches_full_search():
+    """Test searching a PCA projection imputes about as well as the full data."""
+    pytest.importorskip("faiss")
+
+    full, data = make_data(n_rows=3000, n_cols=60, missing=0.005)
+    imputed = data.to_numpy() == 0
+
+    unprojected = imputers.KNN_Imputer(approximate=True)
+    projected = imputers.KNN_Imputer(approximate=True, n_components=8)
+
+    unprojected_values = unprojected.fit_transform(data).to_numpy()
+    projected_values = projected.fit_transform(data).to_numpy()
+
+    assert unprojected.projection is None
+    assert projected.projection is not None
+    assert projected.index.d == 8
+
+    unprojected_error = np.abs(unprojected_values[imputed] - full[imputed]).mean()
+    projected_error = np.abs(projected_values[imputed] - full[imputed]).mean()
+
+    assert projected_error < 1.5 * unprojected_error
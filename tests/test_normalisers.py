@@ -0,0 +1,40 @@
+"""Tests for the normalisers."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn import preprocessing
+
+from auto_bioinformatics import normalisers
+
+
+@pytest.fixture
+def data() -> pd.DataFrame:
+    """Columns on very different scales, with some missing values and a constant."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            "A": rng.normal(0, 1, 50),
+            "B": rng.normal(100, 20, 50),
+            "C": rng.uniform(-5, 5, 50),
+            "D": np.full(50, 2.5),
+        }
+    )
+    data.iloc[[3, 17], 1] = np.nan
+    return data
+
+
+@pytest.mark.parametrize(
+    "normaliser, reference",
+    [
+        (normalisers.StandardScaler, preprocessing.StandardScaler),
+        (normalisers.MinMaxScaler, preprocessing.MinMaxScaler),
+    ],
+)
+def test_scales_each_column(data, normaliser, reference):
+    """Test each column is scaled on its own, matching sklearn."""
+    scaled = normaliser().fit_transform(data)
+    expected = reference().fit_transform(data)
+
+    assert isinstance(scaled, pd.DataFrame)
+    np.testing.assert_allclose(scaled.to_numpy(), expected, rtol=1e-12)
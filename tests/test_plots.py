@@ -0,0 +1,37 @@
+"""Tests for the plots."""
+
+import numpy as np
+import pandas as pd
+
+from auto_bioinformatics.plots import VolcanoPlot
+
+
+def make_volcano(max_labels):
+    """Make a volcano plot where genes 0-9 are significant."""
+    log_fold_changes = pd.Series(np.r_[np.arange(10, 0, -1) * 2.0, np.zeros(20)])
+    p_values = pd.Series(np.r_[np.full(10, 1e-3), np.full(20, 0.5)])
+    labels = pd.Series([f"gene{i}" for i in range(30)])
+
+    return VolcanoPlot(log_fold_changes, p_values, labels, max_labels=max_labels)
+
+
+def labelled_genes(fig):
+    """Get the text of every label on a volcano plot."""
+    return sorted(text.get_text() for text in fig.axes[0].texts)
+
+
+def test_volcano_labels_every_significant_gene_without_cap():
+    """Test every significant gene is labelled when there is no cap."""
+    fig = make_volcano(max_labels=None).plot()
+
+    assert labelled_genes(fig) == sorted(f"gene{i}" for i in range(10))
+
+
+def test_volcano_labels_only_most_extreme_genes():
+    """Test only the most extreme significant genes are labelled over the cap."""
+    fig = make_volcano(max_labels=3).plot()
+
+    assert labelled_genes(fig) == ["gene0", "gene1", "gene2"]
+
+    # Every gene is still drawn
+    assert len(fig.axes[0].collections[0].get_offsets()) == 30